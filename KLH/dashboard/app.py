@@ -2,6 +2,7 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 import os
 
@@ -103,88 +104,157 @@ def load_data():
     data_loader = DataLoader()
     candidates = data_loader.load_candidates()
     jobs = data_loader.load_jobs()
+
+    # Normalized skill sets (skills_set/required_set) are computed by the
+    # model __post_init__ now, so nothing extra to attach here
     return candidates, jobs
 
 
+@st.cache_data(show_spinner=False)
+def find_job_matches(_matching_engine, candidate_dict, job_ids, min_score):
+    """Match a candidate against all jobs, cached across Streamlit reruns.
+
+    The engine is passed with a leading underscore so Streamlit skips
+    hashing it; the cache is keyed by the candidate profile, the job
+    catalog (as a tuple of IDs), and the score threshold.
+    """
+    _, jobs = load_data()
+    candidate = Candidate.from_dict(candidate_dict)
+    return _matching_engine.match_candidate_to_jobs(candidate, jobs, min_score)
+
+
+@st.cache_resource
+def get_matching_engine():
+    """Singleton MatchingEngine shared across reruns and sessions"""
+    return MatchingEngine()
+
+
+@st.cache_data(show_spinner=False)
+def job_locations_lower(job_ids):
+    """job_id -> lowercased location, built once per job catalog"""
+    _, jobs = load_data()
+    return {j.job_id: j.location.lower() for j in jobs}
+
+
+@st.cache_data(show_spinner=False)
+def job_option_labels(job_ids):
+    """Selectbox labels for jobs, built once per job catalog"""
+    _, jobs = load_data()
+    return {f"{j.title} at {j.company} ({j.job_id})": j.job_id for j in jobs}
+
+
+@st.cache_data(show_spinner=False)
+def compute_top_matches(_matching_engine, candidate_ids, job_ids, top_n):
+    """Compute top candidate-job pairs, cached across Streamlit reruns"""
+    candidates, jobs = load_data()
+    return _matching_engine.get_top_matches(candidates, jobs, top_n=top_n)
+
+
+# Score-class lookup tables: index = number of thresholds passed
+_SCORE_THRESHOLDS = np.array([30, 50, 70])
+_SCORE_CLASSES = ('score-low', 'score-fair', 'score-good', 'score-excellent')
+
+
 def get_score_class(score):
     """Get CSS class based on score"""
-    if score >= 70:
-        return "score-excellent"
-    elif score >= 50:
-        return "score-good"
-    elif score >= 30:
-        return "score-fair"
+    return _SCORE_CLASSES[int(np.searchsorted(_SCORE_THRESHOLDS, score, side='right'))]
+
+
+def get_score_classes(scores):
+    """Get CSS classes for an array of scores in one searchsorted pass"""
+    buckets = np.searchsorted(_SCORE_THRESHOLDS, np.asarray(scores), side='right')
+    return [_SCORE_CLASSES[b] for b in buckets]
+
+
+def render_match_card(match, job=None, candidate=None, score_class=None):
+    """Build the HTML for one match result card"""
+    if score_class is None:
+        score_class = get_score_class(match.match_score)
+
+    if job:
+        heading = f"{job.title} at {job.company}"
+    elif candidate:
+        heading = candidate.name
     else:
-        return "score-low"
+        heading = ""
 
+    # match.fmt carries the pre-formatted percentage strings
+    metrics_html = "".join(
+        f'<div class="stat-box"><div class="stat-value">{value}</div>'
+        f'<div class="stat-label">{label}</div></div>'
+        for label, value in zip(("Skills", "Experience", "Location", "Salary"),
+                                match.fmt[1:])
+    )
 
-def display_match_card(match, job=None, candidate=None):
-    """Display a match result card"""
-    score_class = get_score_class(match.match_score)
-    
-    with st.container():
-        st.markdown('<div class="match-card">', unsafe_allow_html=True)
-        
-        # Header with score
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            if job:
-                st.markdown(f"### {job.title} at {job.company}")
-            if candidate:
-                st.markdown(f"### {candidate.name}")
-        with col2:
-            st.markdown(f"""
+    skills_html = ""
+    if match.matched_skills:
+        tags = " ".join(f'<span class="skill-tag matched-skill">{s}</span>'
+                        for s in match.matched_skills)
+        skills_html += f'<p><strong>Matched:</strong> {tags}</p>'
+    if match.missing_skills:
+        tags = " ".join(f'<span class="skill-tag missing-skill">{s}</span>'
+                        for s in match.missing_skills)
+        skills_html += f'<p><strong>Missing:</strong> {tags}</p>'
+
+    return f"""
+    <div class="match-card">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+            <h3>{heading}</h3>
             <div style="text-align: right;">
-                <span class="{score_class}" style="font-size: 32px;">{match.match_score:.1f}%</span>
+                <span class="{score_class}" style="font-size: 32px;">{match.fmt[0]}</span>
                 <br>
-                <span style="color: #7F8C8D;">{match.get_match_level()}</span>
+                <span style="color: #7F8C8D;">{match.level}</span>
             </div>
-            """, unsafe_allow_html=True)
-        
-        # Detailed scores
-        st.markdown("#### Match Breakdown")
-        score_cols = st.columns(4)
-        
-        with score_cols[0]:
-            st.metric("Skills", f"{match.skill_match:.1f}%")
-        with score_cols[1]:
-            st.metric("Experience", f"{match.experience_match:.1f}%")
-        with score_cols[2]:
-            st.metric("Location", f"{match.location_match:.1f}%")
-        with score_cols[3]:
-            st.metric("Salary", f"{match.salary_match:.1f}%")
-        
-        # Skills
-        if match.matched_skills or match.missing_skills:
-            st.markdown("##### Skills")
-            
-            if match.matched_skills:
-                st.markdown("**Matched:** ")
-                skills_html = " ".join([f'<span class="skill-tag matched-skill">{s}</span>' 
-                                       for s in match.matched_skills])
-                st.markdown(skills_html, unsafe_allow_html=True)
-            
-            if match.missing_skills:
-                st.markdown("**Missing:** ")
-                skills_html = " ".join([f'<span class="skill-tag missing-skill">{s}</span>' 
-                                       for s in match.missing_skills])
-                st.markdown(skills_html, unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        </div>
+        <h4>Match Breakdown</h4>
+        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 10px;">
+            {metrics_html}
+        </div>
+        {skills_html}
+    </div>
+    """
 
 
-def candidate_matching_tab(candidates, jobs, matching_engine):
+def display_match_card(match, job=None, candidate=None):
+    """Display a single match result card"""
+    st.markdown(render_match_card(match, job=job, candidate=candidate),
+                unsafe_allow_html=True)
+
+
+def display_match_cards(matches, jobs_by_id=None, candidates_by_id=None):
+    """Display a list of match cards in one st.markdown call.
+
+    Batching the whole results page into a single widget avoids one
+    protobuf message and React mount per card on every rerun.
+    """
+    score_classes = get_score_classes([m.match_score for m in matches])
+    html = "".join(
+        render_match_card(
+            match,
+            job=jobs_by_id[match.job_id] if jobs_by_id else None,
+            candidate=candidates_by_id[match.candidate_id] if candidates_by_id else None,
+            score_class=score_class
+        )
+        for match, score_class in zip(matches, score_classes)
+    )
+    st.markdown(html, unsafe_allow_html=True)
+
+
+def candidate_matching_tab(candidates, jobs, jobs_by_id, matching_engine):
     """Candidate to Job Matching tab"""
     st.markdown('<p class="sub-header">Select or Create a Candidate Profile</p>', unsafe_allow_html=True)
     
     # Candidate selection
     col1, col2 = st.columns([2, 1])
-    
+
+    # Label lookup built once; format_func is called per option per rerun
+    label_map = {c.candidate_id: f"{c.name} ({c.candidate_id})" for c in candidates}
+
     with col1:
         selected_candidate_id = st.selectbox(
             "Select a candidate from sample data:",
-            options=["-- Create New --"] + [c.candidate_id for c in candidates],
-            format_func=lambda x: x if x == "-- Create New --" else f"{candidates[int(x[1:])-1].name} ({x})"
+            options=["-- Create New --"] + list(label_map),
+            format_func=lambda x: label_map.get(x, x)
         )
     
     # Initialize candidate
@@ -240,35 +310,39 @@ def candidate_matching_tab(candidates, jobs, matching_engine):
     # Run matching
     if st.button("Find Matching Jobs", type="primary"):
         with st.spinner("Finding best job matches..."):
-            matches = matching_engine.match_candidate_to_jobs(candidate, jobs, min_score)
+            matches = find_job_matches(
+                matching_engine,
+                candidate.to_dict(),
+                tuple(jobs_by_id),
+                min_score
+            )
             
             # Apply location filter
             if location_filter:
-                matches = [m for m in matches if any(location_filter.lower() in j.location.lower() 
-                                                      for j in jobs if j.job_id == m.job_id)]
-            
+                needle = location_filter.lower()
+                loc_map = job_locations_lower(tuple(jobs_by_id))
+                matches = [m for m in matches if needle in loc_map[m.job_id]]
+
             # Limit results
             matches = matches[:max_results]
-            
+
             st.markdown(f"## Found {len(matches)} Matching Jobs")
-            
+
             if matches:
-                for match in matches:
-                    job = next(j for j in jobs if j.job_id == match.job_id)
-                    display_match_card(match, job=job)
+                display_match_cards(matches, jobs_by_id=jobs_by_id)
             else:
                 st.warning("No jobs match your criteria. Try lowering the minimum score.")
 
 
-def job_matching_tab(candidates, jobs, matching_engine):
+def job_matching_tab(candidates, jobs, candidates_by_id, jobs_by_id, matching_engine):
     """Job to Candidate Matching tab"""
     st.markdown('<p class="sub-header">Select a Job to Find Matching Candidates</p>', unsafe_allow_html=True)
-    
+
     # Job selection
-    job_options = {f"{j.title} at {j.company} ({j.job_id})": j for j in jobs}
+    job_options = job_option_labels(tuple(jobs_by_id))
     selected_job = st.selectbox("Select a job:", options=list(job_options.keys()))
-    
-    job = job_options[selected_job]
+
+    job = jobs_by_id[job_options[selected_job]]
     
     # Display job details
     with st.expander("Job Details", expanded=True):
@@ -298,9 +372,7 @@ def job_matching_tab(candidates, jobs, matching_engine):
             st.markdown(f"## Found {len(matches)} Matching Candidates")
             
             if matches:
-                for match in matches:
-                    candidate = next(c for c in candidates if c.candidate_id == match.candidate_id)
-                    display_match_card(match, candidate=candidate)
+                display_match_cards(matches, candidates_by_id=candidates_by_id)
             else:
                 st.warning("No candidates match your criteria. Try lowering the minimum score.")
 
@@ -309,13 +381,45 @@ def ranking_dashboard_tab(candidates, jobs, matching_engine):
     """Match Ranking Dashboard tab"""
     st.markdown('<p class="sub-header">Top Matching Pairs Across All Data</p>', unsafe_allow_html=True)
     
-    # Get all top matches
-    with st.spinner("Calculating all matches..."):
-        top_matches = matching_engine.get_top_matches(candidates, jobs, top_n=20)
-    
+    top_n = 20
+    rank_key = (
+        tuple(c.candidate_id for c in candidates),
+        tuple(j.job_id for j in jobs),
+        top_n
+    )
+
+    # Persist the matches and derived DataFrame across widget-triggered
+    # reruns; recompute only when the data fingerprint changes
+    if st.session_state.get('rank_key') != rank_key:
+        with st.spinner("Calculating all matches..."):
+            top_matches = compute_top_matches(
+                matching_engine, rank_key[0], rank_key[1], top_n=top_n
+            )
+
+        # Build the DataFrame column-wise with explicit dtypes instead of
+        # letting pandas infer them row-by-row from the list of dicts
+        n = len(top_matches)
+        score_columns = ['match_score', 'skill_match', 'experience_match',
+                         'location_match', 'salary_match']
+        df = pd.DataFrame({
+            'candidate_name': [m['candidate_name'] for m in top_matches],
+            'job_title': [m['job_title'] for m in top_matches],
+            'company': [m['company'] for m in top_matches],
+            **{
+                col: np.fromiter((m[col] for m in top_matches),
+                                 dtype=np.float32, count=n)
+                for col in score_columns
+            }
+        })
+
+        st.session_state['rank_key'] = rank_key
+        st.session_state['rank_matches'] = top_matches
+        st.session_state['rank_df'] = df
+
+    top_matches = st.session_state['rank_matches']
+    df = st.session_state['rank_df']
+
     if top_matches:
-        # Convert to DataFrame for display
-        df = pd.DataFrame(top_matches)
         
         # Display as table
         st.dataframe(
@@ -329,8 +433,9 @@ def ranking_dashboard_tab(candidates, jobs, matching_engine):
         
         with col1:
             st.markdown("### Match Score Distribution")
-            hist_data = df['match_score'].values
-            st.bar_chart(pd.Series(hist_data).value_counts(bins=5).sort_index())
+            counts, edges = np.histogram(df['match_score'].to_numpy(), bins=5)
+            bin_labels = [f"{edges[i]:.0f}-{edges[i+1]:.0f}" for i in range(len(counts))]
+            st.bar_chart(pd.Series(counts, index=bin_labels))
         
         with col2:
             st.markdown("### Component Scores Comparison")
@@ -365,9 +470,13 @@ def main():
         st.error(f"Error loading data: {e}")
         return
     
-    # Initialize matching engine
-    matching_engine = MatchingEngine()
-    
+    # Initialize matching engine (cached resource, built once per process)
+    matching_engine = get_matching_engine()
+
+    # Index by ID once so match lookups are O(1) dict probes
+    jobs_by_id = {j.job_id: j for j in jobs}
+    candidates_by_id = {c.candidate_id: c for c in candidates}
+
     # Sidebar
     st.sidebar.title("Navigation")
     st.sidebar.markdown("---")
@@ -377,10 +486,10 @@ def main():
     tab_candidate, tab_job, tab_ranking = st.tabs(tab_names)
     
     with tab_candidate:
-        candidate_matching_tab(candidates, jobs, matching_engine)
-    
+        candidate_matching_tab(candidates, jobs, jobs_by_id, matching_engine)
+
     with tab_job:
-        job_matching_tab(candidates, jobs, matching_engine)
+        job_matching_tab(candidates, jobs, candidates_by_id, jobs_by_id, matching_engine)
     
     with tab_ranking:
         ranking_dashboard_tab(candidates, jobs, matching_engine)
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for the job matching API"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:5000"
+
+# One worker per core for the CPU-bound matching endpoints, with threads
+# to overlap request I/O; WEB_CONCURRENCY overrides the core count on
+# shared or container-limited hosts
+workers = int(os.environ.get("WEB_CONCURRENCY",
+                             multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = 4
+
+# Load the app (sample data, score matrices) once in the master process,
+# then fork: workers share the read-only data via copy-on-write
+preload_app = True
@@ -1,21 +1,55 @@
 """Flask API routes for job matching"""
 
+import hashlib
+import json
 import os
-from flask import Flask, request, jsonify, render_template
+
+import numpy as np
+from flask import Flask, request, jsonify, render_template, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+
 from src.models.candidate import Candidate
 from src.models.job import Job
 from src.matching.matching_engine import MatchingEngine
 from src.utils.data_loader import DataLoader
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C serializer.
+
+    Also understands NumPy scalars/arrays, so values from the vectorized
+    scoring path can be serialized without .tolist() conversions.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+
 def create_app():
     """Create and configure Flask application"""
 
     app = Flask(__name__, template_folder='../../templates')
     CORS(app)
 
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Initialize components
     data_loader = DataLoader()
     matching_engine = MatchingEngine()
@@ -24,6 +58,30 @@ def create_app():
     candidates = data_loader.load_candidates()
     jobs = data_loader.load_jobs()
 
+    # ID indexes so match enrichment is O(1) per match instead of a scan
+    candidates_by_id = {c.candidate_id: c for c in candidates}
+    jobs_by_id = {j.job_id: j for j in jobs}
+
+    # Positions into the shared score matrix, so endpoints can slice a
+    # row/column instead of rescoring the whole pool per request
+    job_index = {j.job_id: i for i, j in enumerate(jobs)}
+
+    # The list payloads never change while the process runs, so serialize
+    # them once and serve the cached bytes with an ETag; POST results are
+    # memoized by a hash of the raw request body
+    candidates_body = _json_bytes({"candidates": [c.to_dict() for c in candidates]})
+    jobs_body = _json_bytes({"jobs": [j.to_dict() for j in jobs]})
+
+    POST_CACHE_SIZE = 1024
+    post_cache = {}
+    match_all_cache = {}
+
+    def cached_json(body):
+        """Build a JSON response with an ETag, honoring If-None-Match"""
+        resp = app.response_class(body, mimetype='application/json')
+        resp.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+        return resp.make_conditional(request)
+
     # ==============================
     # HOME ROUTE - Serve HTML UI
     # ==============================
@@ -47,18 +105,14 @@ def create_app():
     # ==============================
     @app.route("/api/candidates", methods=["GET"])
     def get_candidates():
-        return jsonify({
-            "candidates": [c.to_dict() for c in candidates]
-        })
+        return cached_json(candidates_body)
 
     # ==============================
     # GET ALL JOBS
     # ==============================
     @app.route("/api/jobs", methods=["GET"])
     def get_jobs():
-        return jsonify({
-            "jobs": [j.to_dict() for j in jobs]
-        })
+        return cached_json(jobs_body)
 
     # ==============================
     # MATCH CANDIDATE TO JOBS
@@ -66,6 +120,11 @@ def create_app():
     @app.route("/api/match", methods=["POST"])
     def match_candidate():
 
+        cache_key = ('match', hashlib.blake2b(request.get_data(), digest_size=16).digest())
+        body = post_cache.get(cache_key)
+        if body is not None:
+            return cached_json(body)
+
         data = request.get_json()
 
         if not data:
@@ -82,10 +141,15 @@ def create_app():
 
         results = []
 
+        # Local bindings keep the enrichment loop free of repeated
+        # attribute lookups
+        append = results.append
+        get_job = jobs_by_id.get
+
         for match in matches:
-            job = next((j for j in jobs if j.job_id == match.job_id), None)
+            job = get_job(match.job_id)
 
-            results.append({
+            append({
                 "candidate_id": match.candidate_id,
                 "job_id": match.job_id,
                 "job_title": job.title if job else "",
@@ -100,45 +164,63 @@ def create_app():
                 "match_level": match.get_match_level()
             })
 
-        return jsonify({
+        body = _json_bytes({
             "candidate": candidate.to_dict(),
             "matches": results,
             "total_matches": len(results)
         })
 
+        if len(post_cache) >= POST_CACHE_SIZE:
+            post_cache.clear()
+        post_cache[cache_key] = body
+
+        return cached_json(body)
+
     # ==============================
     # MATCH ALL CANDIDATES TO A JOB
     # ==============================
     @app.route("/api/match/candidates", methods=["POST"])
     def match_candidates_to_job():
 
+        cache_key = ('candidates', hashlib.blake2b(request.get_data(), digest_size=16).digest())
+        body = post_cache.get(cache_key)
+        if body is not None:
+            return cached_json(body)
+
         data = request.get_json()
 
         if not data or "job_id" not in data:
             return jsonify({"error": "Job ID required"}), 400
 
-        job = next((j for j in jobs if j.job_id == data["job_id"]), None)
+        job = jobs_by_id.get(data["job_id"])
 
         if not job:
             return jsonify({"error": "Job not found"}), 404
 
         min_threshold = data.get("min_threshold", 30.0)
 
-        matches = matching_engine.match_job_to_candidates(
-            job,
-            candidates,
-            min_threshold
-        )
+        # Slice the job's column out of the shared C x J score matrix;
+        # score_matrix memoizes it, so repeat requests skip the scoring pass
+        scores = matching_engine.score_matrix(candidates, jobs)[0][:, job_index[job.job_id]]
+        idx = np.where(scores >= min_threshold)[0]
+        idx = idx[np.argsort(-scores[idx], kind='stable')]
+
+        matches = [
+            matching_engine.match_candidate_to_job(candidates[i], job)
+            for i in idx
+        ]
 
         results = []
 
+        # Local bindings keep the enrichment loop free of repeated
+        # attribute lookups
+        append = results.append
+        get_candidate = candidates_by_id.get
+
         for match in matches:
-            candidate = next(
-                (c for c in candidates if c.candidate_id == match.candidate_id),
-                None
-            )
+            candidate = get_candidate(match.candidate_id)
 
-            results.append({
+            append({
                 "candidate_id": match.candidate_id,
                 "candidate_name": candidate.name if candidate else "",
                 "candidate_email": candidate.email if candidate else "",
@@ -152,12 +234,18 @@ def create_app():
                 "match_level": match.get_match_level()
             })
 
-        return jsonify({
+        body = _json_bytes({
             "job": job.to_dict(),
             "matches": results,
             "total_matches": len(results)
         })
 
+        if len(post_cache) >= POST_CACHE_SIZE:
+            post_cache.clear()
+        post_cache[cache_key] = body
+
+        return cached_json(body)
+
     # ==============================
     # GET ALL MATCHES (For Ranking Dashboard)
     # ==============================
@@ -165,34 +253,54 @@ def create_app():
     def get_all_matches():
         """Get all candidate-job matches for ranking dashboard"""
         min_threshold = request.args.get("min_threshold", 30.0, type=float)
-        
+
+        body = match_all_cache.get(min_threshold)
+        if body is not None:
+            return cached_json(body)
+
         # Get top matches across all candidates and jobs
         all_matches = matching_engine.get_top_matches(candidates, jobs, top_n=200)
-        
+
         # Filter by min_threshold
         filtered_matches = [m for m in all_matches if m['match_score'] >= min_threshold]
-        
-        results = []
-        for match in filtered_matches[:100]:  # Limit to 100 results
-            results.append({
-                "candidate_id": match['candidate_id'],
-                "candidate_name": match['candidate_name'],
-                "job_id": match['job_id'],
-                "job_title": match['job_title'],
-                "company": match['company'],
-                "match_score": round(match['match_score'], 2),
-                "skill_match": round(match['skill_match'], 2),
-                "experience_match": round(match['experience_match'], 2),
-                "location_match": round(match['location_match'], 2),
-                "salary_match": round(match['salary_match'], 2),
-                "matched_skills": match['matched_skills'],
-                "missing_skills": match['missing_skills']
-            })
-        
-        return jsonify({
-            "matches": results,
-            "total_matches": len(results)
-        })
+
+        winners = filtered_matches[:100]  # Limit to 100 results
+
+        def generate():
+            """Stream the response one match at a time; the joined bytes
+            also seed the cache so later requests hit the ETag path."""
+            parts = []
+
+            def emit(chunk):
+                parts.append(chunk)
+                return chunk
+
+            yield emit(b'{"matches":[')
+            for i, match in enumerate(winners):
+                if i:
+                    yield emit(b',')
+                yield emit(_json_bytes({
+                    "candidate_id": match['candidate_id'],
+                    "candidate_name": match['candidate_name'],
+                    "job_id": match['job_id'],
+                    "job_title": match['job_title'],
+                    "company": match['company'],
+                    "match_score": round(match['match_score'], 2),
+                    "skill_match": round(match['skill_match'], 2),
+                    "experience_match": round(match['experience_match'], 2),
+                    "location_match": round(match['location_match'], 2),
+                    "salary_match": round(match['salary_match'], 2),
+                    "matched_skills": match['matched_skills'],
+                    "missing_skills": match['missing_skills']
+                }))
+            yield emit(b'],"total_matches":%d}' % len(winners))
+
+            if len(match_all_cache) >= POST_CACHE_SIZE:
+                match_all_cache.clear()
+            match_all_cache[min_threshold] = b''.join(parts)
+
+        return app.response_class(
+            stream_with_context(generate()), mimetype='application/json')
 
     return app
 
@@ -1,11 +1,13 @@
 """Main entry point for the Smart Job Matching Engine"""
 
+import os
+import subprocess
+
 from src.api.routes import create_app
 
 
 def main():
-    """Run the Flask API server"""
-    app = create_app()
+    """Run the API server (gunicorn when installed, debug server otherwise)"""
     print("=" * 60)
     print("AI-Based Smart Job Matching Engine")
     print("=" * 60)
@@ -20,7 +22,25 @@ def main():
     print("  - GET  /api/match/all       - Get all matches")
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60)
-    app.run(debug=True, port=5000)
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        # Development fallback: single-process Flask debug server
+        print("\ngunicorn not installed - starting the Flask debug server")
+        app = create_app()
+        app.run(debug=True, port=5000)
+        return
+
+    # Production path: multi-process workers, configured in
+    # gunicorn.conf.py (preload_app shares the loaded data across
+    # workers via copy-on-write)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(
+        ["gunicorn", "-c", os.path.join(root, "gunicorn.conf.py"),
+         "src.api.routes:create_app()"],
+        cwd=root
+    )
 
 
 if __name__ == '__main__':
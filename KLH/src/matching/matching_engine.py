@@ -1,6 +1,10 @@
 """Main matching engine that combines all matching algorithms"""
 
+from collections import OrderedDict
 from typing import List, Dict, Tuple
+
+import numpy as np
+
 from ..models.candidate import Candidate
 from ..models.job import Job
 from ..models.match_result import MatchResult
@@ -26,21 +30,71 @@ class MatchingEngine:
     
     # Minimum threshold for considering a match
     MIN_MATCH_THRESHOLD = 30.0
-    
+
+    # Maximum number of memoized pair results
+    PAIR_CACHE_SIZE = 100_000
+
+    # Score boundaries between the low/fair/good/excellent match levels
+    LEVEL_THRESHOLDS = np.array([30.0, 50.0, 70.0])
+
     def __init__(self, weights: Dict = None):
         """
         Initialize the matching engine.
-        
+
         Args:
             weights: Optional custom weights for matching criteria
         """
         self.weights = weights or self.DEFAULT_WEIGHTS
-        
+
+        # Weight vector ordered like _component_matrices, so the batch
+        # paths can combine components with one BLAS dot product
+        self._weight_vec = np.array([
+            self.weights['skills'], self.weights['experience'],
+            self.weights['location'], self.weights['salary']
+        ])
+
+        # Weights are fixed after construction, so specialize the scalar
+        # combination once: the weights become bytecode constants and the
+        # per-pair path skips four dict lookups
+        self._combine = eval(compile(
+            "lambda skill, experience, salary, location: "
+            f"skill * {self.weights['skills']!r} + "
+            f"experience * {self.weights['experience']!r} + "
+            f"salary * {self.weights['salary']!r} + "
+            f"location * {self.weights['location']!r}",
+            '<weights>', 'eval'))
+
         # Initialize individual matchers
         self.skill_matcher = SkillMatcher()
         self.experience_matcher = ExperienceMatcher()
         self.location_matcher = LocationMatcher()
         self.salary_matcher = SalaryMatcher()
+
+        # LRU memo of pair results so repeat endpoint calls and dashboard
+        # refreshes reuse scores instead of recomputing them
+        self._pair_cache = OrderedDict()
+        self._matrix_cache = None
+        self._version = 0
+
+    def invalidate_cache(self):
+        """Drop all memoized pair results (call after a data reload)"""
+        self._version += 1
+        self._pair_cache.clear()
+        self._matrix_cache = None
+
+    @staticmethod
+    def _pair_key(candidate: Candidate, job: Job) -> Tuple:
+        """Cache key covering every attribute that feeds the score.
+
+        IDs alone are not enough: ad-hoc candidates posted to the API can
+        reuse an ID with a different profile.
+        """
+        return (
+            candidate.candidate_id, tuple(candidate.skills),
+            candidate.years_experience, candidate.education,
+            candidate.preferred_location, candidate.expected_salary,
+            job.job_id
+        )
     
     def match_candidate_to_job(
         self, 
@@ -57,24 +111,43 @@ class MatchingEngine:
         Returns:
             MatchResult with all matching details
         """
-        # Calculate individual match scores
+        key = (self._version,) + self._pair_key(candidate, job)
+        cached = self._pair_cache.get(key)
+        if cached is not None:
+            self._pair_cache.move_to_end(key)
+            return cached
+
+        # Calculate individual match scores (normalized skills and sets
+        # are precomputed by the models at construction)
         skill_match, matched_skills, missing_skills = self.skill_matcher.calculate_skill_match(
-            candidate.skills, 
-            job.required_skills
+            candidate.skills,
+            job.required_skills,
+            normalized_candidate=candidate.skills_norm,
+            normalized_job=job.required_norm,
+            candidate_set=candidate.skills_set,
+            job_set=job.required_set
         )
         
         experience_match = self.experience_matcher.calculate_combined_experience_match(
             candidate.years_experience,
             job.min_experience,
-            candidate.education,
-            job.education_required
+            getattr(candidate, 'education_level', candidate.education),
+            getattr(job, 'education_level_required', job.education_required)
         )
         
-        location_match = self.location_matcher.calculate_location_match(
-            candidate.preferred_location,
-            job.location,
-            job.is_remote
-        )
+        # Use the pre-parsed locations when the loader attached them;
+        # ad-hoc records fall back to the string (cached) path
+        cand_loc = getattr(candidate, 'location_parsed', None)
+        job_loc = getattr(job, 'location_parsed', None)
+        if cand_loc is not None and job_loc is not None:
+            location_match = self.location_matcher.match_parsed(
+                cand_loc, job_loc, job.is_remote)
+        else:
+            location_match = self.location_matcher.calculate_location_match(
+                candidate.preferred_location,
+                job.location,
+                job.is_remote
+            )
         
         salary_match = self.salary_matcher.calculate_salary_match(
             candidate.expected_salary,
@@ -82,16 +155,14 @@ class MatchingEngine:
             job.salary_max
         )
         
-        # Calculate weighted overall match score
-        overall_match = (
-            (skill_match * self.weights['skills']) +
-            (experience_match * self.weights['experience']) +
-            (salary_match * self.weights['salary']) +
-            (location_match * self.weights['location'])
-        )
+        # Calculate weighted overall match score (weights folded into
+        # the specialized closure built in __init__)
+        overall_match = self._combine(
+            skill_match, experience_match, salary_match, location_match)
         
-        # Create match result
-        result = MatchResult(
+        # Create match result (components are pre-clamped by the
+        # matchers, so the unchecked constructor is safe here)
+        result = MatchResult.unchecked(
             candidate_id=candidate.candidate_id,
             job_id=job.job_id,
             match_score=overall_match,
@@ -102,68 +173,91 @@ class MatchingEngine:
             matched_skills=matched_skills,
             missing_skills=missing_skills
         )
-        
+
+        self._pair_cache[key] = result
+        if len(self._pair_cache) > self.PAIR_CACHE_SIZE:
+            self._pair_cache.popitem(last=False)
+
         return result
     
     def match_candidate_to_jobs(
-        self, 
-        candidate: Candidate, 
+        self,
+        candidate: Candidate,
         jobs: List[Job],
-        min_threshold: float = None
+        min_threshold: float = None,
+        top_k: int = None
     ) -> List[MatchResult]:
         """
         Match a candidate to multiple jobs.
-        
+
         Args:
             candidate: The candidate to match
             jobs: List of jobs to match against
             min_threshold: Minimum match score to include (default: MIN_MATCH_THRESHOLD)
-            
+            top_k: Return only the k best matches; selected with an O(N)
+                partition rather than a full sort
+
         Returns:
             List of MatchResults, sorted by match score (descending)
         """
         threshold = min_threshold or self.MIN_MATCH_THRESHOLD
-        
-        results = []
-        for job in jobs:
-            result = self.match_candidate_to_job(candidate, job)
-            if result.match_score >= threshold:
-                results.append(result)
-        
-        # Sort by match score (highest first)
-        results.sort(key=lambda x: x.match_score, reverse=True)
-        
-        return results
-    
+
+        if not jobs:
+            return []
+
+        # Score everything vectorized, then materialize MatchResults only
+        # for the pairs that clear the threshold
+        scores = self._score_matrix([candidate], jobs)[0]
+        idx = np.where(scores >= threshold)[0]
+        idx = self._order_desc(scores, idx, top_k)
+
+        return [self.match_candidate_to_job(candidate, jobs[i]) for i in idx]
+
     def match_job_to_candidates(
-        self, 
-        job: Job, 
+        self,
+        job: Job,
         candidates: List[Candidate],
-        min_threshold: float = None
+        min_threshold: float = None,
+        top_k: int = None
     ) -> List[MatchResult]:
         """
         Match a job to multiple candidates.
-        
+
         Args:
             job: The job to match
             candidates: List of candidates to match against
             min_threshold: Minimum match score to include
-            
+            top_k: Return only the k best matches; selected with an O(N)
+                partition rather than a full sort
+
         Returns:
             List of MatchResults, sorted by match score (descending)
         """
         threshold = min_threshold or self.MIN_MATCH_THRESHOLD
-        
-        results = []
-        for candidate in candidates:
-            result = self.match_candidate_to_job(candidate, job)
-            if result.match_score >= threshold:
-                results.append(result)
-        
-        # Sort by match score (highest first)
-        results.sort(key=lambda x: x.match_score, reverse=True)
-        
-        return results
+
+        if not candidates:
+            return []
+
+        scores = self._score_matrix(candidates, [job])[:, 0]
+        idx = np.where(scores >= threshold)[0]
+        idx = self._order_desc(scores, idx, top_k)
+
+        return [self.match_candidate_to_job(candidates[i], job) for i in idx]
+
+    @staticmethod
+    def _order_desc(
+        scores: np.ndarray,
+        idx: np.ndarray,
+        top_k: int = None
+    ) -> np.ndarray:
+        """
+        Order candidate indices by descending score; with top_k, an O(N)
+        argpartition narrows the field before the small final sort.
+        """
+        if top_k is not None and 0 < top_k < idx.size:
+            kth = idx.size - top_k
+            idx = idx[np.argpartition(scores[idx], kth)[kth:]]
+        return idx[np.argsort(-scores[idx], kind='stable')]
     
     def match_all(
         self, 
@@ -183,58 +277,245 @@ class MatchingEngine:
             Dictionary mapping candidate_id to their matched jobs
         """
         threshold = min_threshold or self.MIN_MATCH_THRESHOLD
-        
+
+        if not candidates or not jobs:
+            return {c.candidate_id: [] for c in candidates}
+
+        # One (C, J) scoring pass for the whole pool; each candidate's
+        # row is then thresholded and ordered without rescoring
+        scores = self.score_matrix(candidates, jobs)[0]
+
         matches = {}
-        for candidate in candidates:
-            matches[candidate.candidate_id] = self.match_candidate_to_jobs(
-                candidate, 
-                jobs, 
-                threshold
-            )
-        
+        for i, candidate in enumerate(candidates):
+            row = scores[i]
+            idx = np.where(row >= threshold)[0]
+            idx = idx[np.argsort(-row[idx], kind='stable')]
+            matches[candidate.candidate_id] = [
+                self.match_candidate_to_job(candidate, jobs[j]) for j in idx
+            ]
+
         return matches
     
+    def _vectorize_pool(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Extract the numeric candidate/job attributes into parallel arrays
+        so the experience and salary components can be computed as
+        broadcasted (C, J) matrix operations. The models own the
+        structure-of-arrays conversion (Candidate.stack / Job.stack).
+        """
+        cand = Candidate.stack(candidates)
+        job = Job.stack(jobs)
+        return {
+            'cand_exp': cand['years_experience'],
+            'cand_edu': cand['education_level'],
+            'cand_salary': cand['expected_salary'],
+            'job_min_exp': job['min_experience'],
+            'job_edu': job['education_level_required'],
+            'job_sal_min': job['salary_min'],
+            'job_sal_max': job['salary_max'],
+        }
+
+    def _experience_matrix(self, pool: Dict[str, np.ndarray]) -> np.ndarray:
+        """Combined experience/education match for all pairs, shape (C, J)"""
+        return self.experience_matcher.calculate_combined_experience_match_batch(
+            pool['cand_exp'][:, None],
+            pool['job_min_exp'][None, :],
+            pool['cand_edu'][:, None],
+            pool['job_edu'][None, :]
+        )
+
+    def _salary_matrix(self, pool: Dict[str, np.ndarray]) -> np.ndarray:
+        """Salary compatibility for all pairs, shape (C, J)"""
+        return self.salary_matcher.calculate_salary_match_batch(
+            pool['cand_salary'][:, None],
+            pool['job_sal_min'][None, :],
+            pool['job_sal_max'][None, :]
+        )
+
+    def _location_matrix(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> np.ndarray:
+        """Location match for all pairs, memoized over unique location pairs"""
+        scores = np.empty((len(candidates), len(jobs)), dtype=np.float64)
+        cache = {}
+        for j, job in enumerate(jobs):
+            for c, candidate in enumerate(candidates):
+                key = (candidate.preferred_location, job.location, job.is_remote)
+                score = cache.get(key)
+                if score is None:
+                    score = cache[key] = self.location_matcher.calculate_location_match(*key)
+                scores[c, j] = score
+        return scores
+
+    def _skill_matrix(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> np.ndarray:
+        """Skill match for all pairs, shape (C, J).
+
+        The exact-match component is computed for every pair at once via
+        bitmasks over a shared vocabulary (one AND + popcount per 64
+        skills); skills are normalized once per record instead of once
+        per pair. The TF-IDF partial component keeps the scalar path.
+
+        The vocabulary, masks and prepared rows are all locals tied to
+        this call's pool: concurrent requests scoring different pools
+        through one engine must not see each other's state.
+        """
+        matcher = self.skill_matcher
+        norm_cand = [c.skills_norm for c in candidates]
+        norm_job = [j.required_norm for j in jobs]
+
+        vocab = matcher.build_vocabulary(norm_cand + norm_job)
+        prepared = matcher.prepare(norm_cand + norm_job)
+        cand_masks = np.stack([matcher.encode_mask(s, vocab) for s in norm_cand])
+        job_masks = np.stack([matcher.encode_mask(s, vocab) for s in norm_job])
+
+        scores = matcher.exact_match_matrix(
+            cand_masks, job_masks,
+            np.array([len(skills) for skills in norm_job]))
+
+        # Blend in the TF-IDF partial component with the same 70/30 split
+        # as calculate_skill_match; NaN marks pairs with an empty skill
+        # list, which stay exact-only
+        partial = matcher.partial_match_matrix(norm_cand, norm_job, prepared)
+        if partial is not None:
+            blend = np.isfinite(partial)
+            scores[blend] = scores[blend] * 0.7 + partial[blend] * 0.3
+
+        np.minimum(scores, 100.0, out=scores)
+        return scores
+
+    def _component_matrices(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """All four component score matrices, each shape (C, J)"""
+        pool = self._vectorize_pool(candidates, jobs)
+        return (
+            self._skill_matrix(candidates, jobs),
+            self._experience_matrix(pool),
+            self._location_matrix(candidates, jobs),
+            self._salary_matrix(pool)
+        )
+
+    def _score_matrix(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> np.ndarray:
+        """Weighted overall match scores for all pairs, shape (C, J)"""
+        components = self._component_matrices(candidates, jobs)
+        return np.stack(components, axis=-1) @ self._weight_vec
+
+    def score_matrix(
+        self,
+        candidates: List[Candidate],
+        jobs: List[Job]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Overall and component score matrices for all pairs, memoized.
+
+        Returns (overall, skill, experience, location, salary), each of
+        shape (C, J). The result is cached against the identity of the
+        candidate/job lists - the cache entry keeps a reference to the
+        exact list objects, so a later list can never alias a collected
+        one's id - and every endpoint working off the same loaded data
+        shares one matrix per data version; a data reload should call
+        invalidate_cache() to drop it.
+
+        Args:
+            candidates: List of candidates
+            jobs: List of jobs
+
+        Returns:
+            Tuple of five (C, J) score matrices
+        """
+        cached = self._matrix_cache
+        if (cached is not None and cached[0] is candidates
+                and cached[1] is jobs and cached[2] == self._version):
+            return cached[3]
+
+        components = self._component_matrices(candidates, jobs)
+        overall = np.stack(components, axis=-1) @ self._weight_vec
+
+        matrices = (overall,) + components
+        self._matrix_cache = (candidates, jobs, self._version, matrices)
+        return matrices
+
     def get_top_matches(
-        self, 
-        candidates: List[Candidate], 
+        self,
+        candidates: List[Candidate],
         jobs: List[Job],
         top_n: int = 10
     ) -> List[Dict]:
         """
         Get top N matches across all candidate-job pairs.
-        
+
+        Scores are computed as (C, J) matrices over SoA attribute arrays;
+        only the winning pairs are materialized as dictionaries.
+
         Args:
             candidates: List of candidates
             jobs: List of jobs
             top_n: Number of top matches to return
-            
+
         Returns:
             List of dictionaries with match details
         """
-        all_matches = []
-        
-        for candidate in candidates:
-            for job in jobs:
-                result = self.match_candidate_to_job(candidate, job)
-                all_matches.append({
-                    'candidate_id': candidate.candidate_id,
-                    'candidate_name': candidate.name,
-                    'job_id': job.job_id,
-                    'job_title': job.title,
-                    'company': job.company,
-                    'match_score': result.match_score,
-                    'skill_match': result.skill_match,
-                    'experience_match': result.experience_match,
-                    'location_match': result.location_match,
-                    'salary_match': result.salary_match,
-                    'matched_skills': result.matched_skills,
-                    'missing_skills': result.missing_skills
-                })
-        
-        # Sort by match score and get top N
-        all_matches.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return all_matches[:top_n]
+        if not candidates or not jobs:
+            return []
+
+        overall, skill_scores, experience_scores, location_scores, salary_scores = \
+            self.score_matrix(candidates, jobs)
+
+        # Top-N via partition on the flattened score matrix; partitioning for
+        # the largest kth avoids negating the full array just to select
+        flat = overall.ravel()
+        top_n = min(top_n, flat.size)
+        if top_n < flat.size:
+            kth = flat.size - top_n
+            top_idx = np.argpartition(flat, kth)[kth:]
+        else:
+            top_idx = np.arange(flat.size)
+        top_idx = top_idx[np.argsort(-flat[top_idx])]
+
+        n_jobs = len(jobs)
+        top_matches = []
+        for idx in top_idx:
+            c, j = divmod(int(idx), n_jobs)
+            candidate, job = candidates[c], jobs[j]
+            # Matched/missing skill lists are only needed for the winners
+            _, matched_skills, missing_skills = self.skill_matcher.calculate_skill_match(
+                candidate.skills, job.required_skills,
+                normalized_candidate=candidate.skills_norm,
+                normalized_job=job.required_norm,
+                candidate_set=candidate.skills_set,
+                job_set=job.required_set)
+            top_matches.append({
+                'candidate_id': candidate.candidate_id,
+                'candidate_name': candidate.name,
+                'job_id': job.job_id,
+                'job_title': job.title,
+                'company': job.company,
+                'match_score': flat[idx],
+                'skill_match': skill_scores[c, j],
+                'experience_match': experience_scores[c, j],
+                'location_match': location_scores[c, j],
+                'salary_match': salary_scores[c, j],
+                'matched_skills': matched_skills,
+                'missing_skills': missing_skills
+            })
+
+        return top_matches
     
     def get_match_statistics(self, matches: List[MatchResult]) -> Dict:
         """
@@ -258,15 +539,20 @@ class MatchingEngine:
                 'low_matches': 0
             }
         
-        scores = [m.match_score for m in matches]
-        
+        # Vectorized: one C-level pass for the buckets, one reduction each
+        # for the summary stats
+        scores = np.fromiter(
+            (m.match_score for m in matches), dtype=np.float64, count=len(matches))
+        buckets = np.searchsorted(self.LEVEL_THRESHOLDS, scores, side='right')
+        counts = np.bincount(buckets, minlength=4)
+
         return {
             'count': len(matches),
-            'avg_score': sum(scores) / len(scores),
-            'min_score': min(scores),
-            'max_score': max(scores),
-            'excellent_matches': len([s for s in scores if s >= 70]),
-            'good_matches': len([s for s in scores if 50 <= s < 70]),
-            'fair_matches': len([s for s in scores if 30 <= s < 50]),
-            'low_matches': len([s for s in scores if s < 30])
+            'avg_score': float(scores.mean()),
+            'min_score': float(scores.min()),
+            'max_score': float(scores.max()),
+            'excellent_matches': int(counts[3]),
+            'good_matches': int(counts[2]),
+            'fair_matches': int(counts[1]),
+            'low_matches': int(counts[0])
         }
@@ -2,6 +2,39 @@
 
 from typing import Tuple, Dict
 
+import numpy as np
+
+from ..utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _salary_match(expected_salary: int, salary_min: int, salary_max: int) -> float:
+    """Numeric core of the salary match (JIT-compiled when available)"""
+    # Handle case where no salary info is provided
+    if salary_min == 0 and salary_max == 0:
+        return 100.0  # Can't evaluate, assume match
+
+    if expected_salary == 0:
+        return 100.0  # Candidate hasn't specified, assume match
+
+    # Calculate midpoint of job salary range
+    salary_mid = (salary_min + salary_max) / 2
+
+    # Check if expected salary is within range
+    if salary_min <= expected_salary <= salary_max:
+        return 100.0
+
+    if expected_salary < salary_min:
+        # Candidate expects less than minimum; lose up to 30%
+        pct_diff = ((salary_min - expected_salary) / salary_mid) * 100
+        match = 100.0 - min(pct_diff, 30.0)
+    else:
+        # Candidate expects more than maximum; lose up to 40%
+        pct_diff = ((expected_salary - salary_max) / salary_mid) * 100
+        match = 100.0 - min(pct_diff, 40.0)
+
+    return max(30.0, match)  # Minimum 30% match
+
 
 class SalaryMatcher:
     """Handles salary-based matching between candidates and jobs"""
@@ -26,36 +59,49 @@ class SalaryMatcher:
         Returns:
             Match percentage (0-100)
         """
-        # Handle case where no salary info is provided
-        if salary_min == 0 and salary_max == 0:
-            return 100.0  # Can't evaluate, assume match
-        
-        if expected_salary == 0:
-            return 100.0  # Candidate hasn't specified, assume match
-        
-        # Calculate midpoint of job salary range
-        salary_mid = (salary_min + salary_max) / 2
-        
-        # Check if expected salary is within range
-        if salary_min <= expected_salary <= salary_max:
-            return 100.0
-        
-        # Calculate percentage difference from midpoint
-        if expected_salary < salary_min:
-            # Candidate expects less than minimum
-            diff = salary_min - expected_salary
-            pct_diff = (diff / salary_mid) * 100
-            # Lose up to 30% based on how much below
-            match = 100.0 - min(pct_diff, 30.0)
-        else:
-            # Candidate expects more than maximum
-            diff = expected_salary - salary_max
-            pct_diff = (diff / salary_mid) * 100
-            # Lose up to 40% based on how much above
-            match = 100.0 - min(pct_diff, 40.0)
-        
-        return max(30.0, match)  # Minimum 30% match
-    
+        return _salary_match(expected_salary, salary_min, salary_max)
+
+    def calculate_salary_match_batch(
+        self,
+        expected_salary: np.ndarray,
+        salary_min: np.ndarray,
+        salary_max: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized salary match over broadcastable arrays.
+
+        Branch-for-branch mirror of _salary_match, evaluated with
+        np.where so a whole candidate-by-job grid is scored in a few
+        C-level passes.
+
+        Args:
+            expected_salary: Candidate expected salaries
+            salary_min: Job minimum salaries
+            salary_max: Job maximum salaries
+
+        Returns:
+            Array of match percentages, broadcast shape of the inputs
+        """
+        expected = np.asarray(expected_salary, dtype=np.float64)
+        sal_min = np.asarray(salary_min, dtype=np.float64)
+        sal_max = np.asarray(salary_max, dtype=np.float64)
+
+        sal_mid = (sal_min + sal_max) / 2
+        safe_mid = np.where(sal_mid == 0, 1.0, sal_mid)
+
+        below = np.maximum(
+            30.0, 100.0 - np.minimum((sal_min - expected) / safe_mid * 100, 30.0))
+        above = np.maximum(
+            30.0, 100.0 - np.minimum((expected - sal_max) / safe_mid * 100, 40.0))
+
+        no_info = (sal_min == 0) & (sal_max == 0)
+        unmatchable = no_info | (expected == 0)
+        in_range = (sal_min <= expected) & (expected <= sal_max)
+
+        return np.where(unmatchable | in_range,
+                        100.0,
+                        np.where(expected < sal_min, below, above))
+
     def get_salary_details(
         self,
         expected_salary: int,
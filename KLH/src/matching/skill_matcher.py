@@ -1,7 +1,8 @@
 """Skill matching algorithm using TF-IDF and cosine similarity"""
 
+from functools import lru_cache
 from typing import List, Tuple, Dict
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
@@ -34,72 +35,329 @@ class SkillMatcher:
     }
     
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(
+        # Hashing instead of TF-IDF: stateless (no fit, no vocabulary
+        # build) and corpus-independent, so a skill's vector is the same
+        # whatever pool it is scored against. L2-normalized rows keep
+        # dot products equal to cosine similarity.
+        self.vectorizer = HashingVectorizer(
             lowercase=True,
             token_pattern=r'(?u)\b\w+\b',
-            ngram_range=(1, 2)
+            ngram_range=(1, 2),
+            n_features=2 ** 14,
+            alternate_sign=False,
+            norm='l2'
         )
+
+        # Set by prepare(): (skill index, vector rows) published as one
+        # tuple so concurrent readers always see a matching pair
+        self._prepared = None
     
-    def normalize_skill(self, skill: str) -> str:
-        """Normalize skill name using aliases"""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def normalize_skill(skill: str) -> str:
+        """Normalize skill name using aliases.
+
+        Memoized: the same skill strings recur across every candidate and
+        job, so hot tokens skip the strip/upper allocations entirely.
+        """
         skill_upper = skill.strip().upper()
-        return self.SKILL_ALIASES.get(skill_upper, skill_upper)
+        return SkillMatcher.SKILL_ALIASES.get(skill_upper, skill_upper)
+
+    def build_vocabulary(self, skill_lists: List[List[str]]) -> Dict[str, int]:
+        """
+        Build a global skill vocabulary mapping each normalized skill to a
+        bit position, enabling bitmask-based matching.
+
+        The vocabulary is returned rather than stored: it belongs to one
+        pool of skill lists, and batch scoring calls can run concurrently
+        with different pools on a shared matcher.
+
+        Args:
+            skill_lists: All candidate and job skill lists
+
+        Returns:
+            Dictionary mapping normalized skill -> bit index
+        """
+        vocab = {}
+        for skills in skill_lists:
+            for skill in skills:
+                normalized = self.normalize_skill(skill)
+                if normalized not in vocab:
+                    vocab[normalized] = len(vocab)
+        return vocab
+
+    def encode_mask(self, skills: List[str], vocab: Dict[str, int]) -> np.ndarray:
+        """
+        Encode a skill list as a uint64 bitmask array over the given
+        vocabulary (one bit per vocabulary skill, 64 skills per lane).
+        Skills outside the vocabulary are ignored - they cannot match
+        anything in it.
+        """
+        n_lanes = max(1, -(-len(vocab) // 64))
+        mask = np.zeros(n_lanes, dtype=np.uint64)
+        for skill in skills:
+            idx = vocab.get(self.normalize_skill(skill))
+            if idx is not None:
+                lane, bit = divmod(idx, 64)
+                mask[lane] |= np.uint64(1) << np.uint64(bit)
+        return mask
+
+    def prepare(self, skill_lists: List[List[str]]) -> Tuple[Dict[str, int], object]:
+        """
+        Vectorize every unique normalized skill once, one row per skill.
+
+        calculate_skill_match refits a fresh vectorizer per pair when this
+        has not been called; after preparation the partial component is a
+        single small sparse dot product per pair. Rows come out of the
+        vectorizer L2-normalized, so their dot product is already the
+        cosine similarity.
+
+        Returns the (skill index, rows) pair for callers that need
+        call-local state (the batch matrix path), and also publishes it -
+        as a single tuple, so a concurrent reader never sees an index
+        from one pool with rows from another - for the scalar fast path.
+
+        Args:
+            skill_lists: All candidate and job skill lists to cover
+
+        Returns:
+            Tuple of (skill -> row index dict, sparse row matrix), or
+            None when there are no skills or vectorization fails
+        """
+        unique = {}
+        for skills in skill_lists:
+            for skill in skills:
+                normalized = self.normalize_skill(skill)
+                if normalized not in unique:
+                    unique[normalized] = len(unique)
+
+        if not unique:
+            return self._prepared
+
+        try:
+            prepared = (unique, self.vectorizer.fit_transform(list(unique)))
+        except Exception:
+            return self._prepared
+
+        self._prepared = prepared
+        return prepared
+
+    @staticmethod
+    def _popcount(masks: np.ndarray) -> np.ndarray:
+        """Count set bits along the last (lane) axis of a uint64 array"""
+        if hasattr(np, 'bitwise_count'):  # numpy >= 2.0
+            return np.bitwise_count(masks).sum(axis=-1)
+        as_bytes = masks.view(np.uint8)
+        return np.unpackbits(as_bytes, axis=-1).sum(axis=-1)
+
+    def exact_match_matrix(
+        self,
+        cand_masks: np.ndarray,
+        job_masks: np.ndarray,
+        required_counts: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Exact skill-match percentages for all candidate-job pairs.
+
+        Args:
+            cand_masks: (C, L) uint64 bitmask array for candidates
+            job_masks: (J, L) uint64 bitmask array for jobs
+            required_counts: Optional (J,) required-skill list lengths.
+                calculate_skill_match divides by the raw list length, so
+                passing these keeps both paths identical when alias
+                normalization collapses duplicate skills; defaults to
+                the unique bit counts.
+
+        Returns:
+            (C, J) array of exact-match percentages
+        """
+        matched = self._popcount(cand_masks[:, None, :] & job_masks[None, :, :])
+        if required_counts is None:
+            required = self._popcount(job_masks)
+        else:
+            required = np.asarray(required_counts)
+        # Jobs with no required skills count as a perfect match
+        return np.where(required == 0, 100.0,
+                        matched / np.maximum(required, 1) * 100.0)
     
+    def partial_match_matrix(
+        self,
+        cand_skill_lists: List[List[str]],
+        job_skill_lists: List[List[str]],
+        prepared: Tuple[Dict[str, int], object] = None
+    ) -> np.ndarray:
+        """
+        TF-IDF partial-match percentages for all pairs in one batch.
+
+        Requires a prepare() result covering every skill in the lists;
+        pass it in so concurrent batch calls on a shared matcher each
+        work off their own snapshot. The unique-skill similarity matrix
+        is computed with a single sparse matmul; each pair entry is then
+        the mean over the job's skills of the best candidate-skill
+        similarity, exactly as in _partial_match_pct. Entries for empty
+        skill lists are NaN, which callers should leave unblended.
+
+        Args:
+            cand_skill_lists: Normalized candidate skill lists
+            job_skill_lists: Normalized job skill lists
+            prepared: A prepare() result; defaults to the last published
+
+        Returns:
+            (C, J) array of partial-match percentages, or None when the
+            matcher has not been prepared
+        """
+        if prepared is None:
+            prepared = self._prepared
+        if prepared is None:
+            return None
+
+        index, tfidf_rows = prepared
+        # All-pairs similarity over unique skills: one sparse matmul
+        sims = (tfidf_rows @ tfidf_rows.T).toarray()
+
+        # Best similarity from each candidate to every unique skill
+        best = np.empty((len(cand_skill_lists), sims.shape[0]))
+        for c, skills in enumerate(cand_skill_lists):
+            if skills:
+                best[c] = sims[[index[s] for s in skills]].max(axis=0)
+            else:
+                best[c] = np.nan
+
+        # Mean over each job's (possibly duplicated) skill entries
+        out = np.empty((len(cand_skill_lists), len(job_skill_lists)))
+        for j, skills in enumerate(job_skill_lists):
+            if skills:
+                out[:, j] = best[:, [index[s] for s in skills]].mean(axis=1) * 100
+            else:
+                out[:, j] = np.nan
+        return out
+
     def calculate_skill_match(
-        self, 
-        candidate_skills: List[str], 
-        job_skills: List[str]
+        self,
+        candidate_skills: List[str],
+        job_skills: List[str],
+        normalized_candidate: Tuple[str, ...] = None,
+        normalized_job: Tuple[str, ...] = None,
+        candidate_set: frozenset = None,
+        job_set: frozenset = None
     ) -> Tuple[float, List[str], List[str]]:
         """
         Calculate skill match percentage between candidate and job requirements.
-        
+
         Args:
             candidate_skills: List of skills the candidate has
             job_skills: List of skills required by the job
-            
+            normalized_candidate: Optional pre-normalized candidate skills
+            normalized_job: Optional pre-normalized job skills
+            candidate_set: Optional set of the normalized candidate skills
+            job_set: Optional set of the normalized job skills
+
         Returns:
             Tuple of (match_percentage, matched_skills, missing_skills)
         """
-        # Normalize skills
-        normalized_candidate = [self.normalize_skill(s) for s in candidate_skills]
-        normalized_job = [self.normalize_skill(s) for s in job_skills]
-        
+        # Normalize skills unless the caller precomputed them (the models
+        # build these once at construction); the cached worker needs
+        # hashable forms
+        if normalized_candidate is None:
+            normalized_candidate = tuple(self.normalize_skill(s) for s in candidate_skills)
+        elif not isinstance(normalized_candidate, tuple):
+            normalized_candidate = tuple(normalized_candidate)
+        if normalized_job is None:
+            normalized_job = tuple(self.normalize_skill(s) for s in job_skills)
+        elif not isinstance(normalized_job, tuple):
+            normalized_job = tuple(normalized_job)
+        if candidate_set is None or not isinstance(candidate_set, frozenset):
+            candidate_set = frozenset(
+                normalized_candidate if candidate_set is None else candidate_set)
+        if job_set is None or not isinstance(job_set, frozenset):
+            job_set = frozenset(normalized_job if job_set is None else job_set)
+
+        score, matched, missing = self._cached_skill_match(
+            normalized_candidate, normalized_job, candidate_set, job_set)
+        # Fresh lists per call: cached tuples must stay immutable
+        return score, list(matched), list(missing)
+
+    @lru_cache(maxsize=8192)
+    def _cached_skill_match(
+        self,
+        normalized_candidate: Tuple[str, ...],
+        normalized_job: Tuple[str, ...],
+        candidate_set: frozenset,
+        job_set: frozenset
+    ) -> Tuple[float, tuple, tuple]:
+        """
+        Memoized worker behind calculate_skill_match.
+
+        Distinct skill-list combinations are far fewer than pairs in
+        batch scoring (many postings share a required set), so repeats
+        collapse to a cache hit. Safe to memoize across prepare() calls:
+        the hashing vectorizer is corpus-independent, so a pair's score
+        does not depend on which pool it was prepared with.
+        """
         # Find exact matches
-        matched = set(normalized_candidate) & set(normalized_job)
-        missing = set(normalized_job) - set(normalized_candidate)
-        
+        matched = candidate_set & job_set
+        missing = job_set - candidate_set
+
         # Calculate exact match percentage
         if len(normalized_job) == 0:
-            return 100.0, list(matched), list(missing)
-        
+            return 100.0, tuple(matched), tuple(missing)
+
+        # Early out: every required skill matched exactly. The partial
+        # component is 100 too (each job skill's best similarity is to
+        # itself), so the blend is a foregone conclusion - skip the
+        # vectorizer work entirely
+        if not missing and len(matched) == len(normalized_job):
+            return 100.0, tuple(matched), ()
+
         exact_match_pct = (len(matched) / len(normalized_job)) * 100
-        
+
         # Use TF-IDF for partial matching
         if len(normalized_candidate) > 0 and len(normalized_job) > 0:
-            # Create corpus for TF-IDF
-            corpus = normalized_candidate + normalized_job
-            try:
-                tfidf_matrix = self.vectorizer.fit_transform(corpus)
-                
-                # Get vectors for candidate and job skills
-                candidate_vector = tfidf_matrix[:len(normalized_candidate)]
-                job_vector = tfidf_matrix[len(normalized_candidate):]
-                
-                # Calculate cosine similarity
-                similarities = cosine_similarity(candidate_vector, job_vector)
-                
-                # Get best match for each job skill
-                best_matches = similarities.max(axis=0)
-                partial_match_pct = np.mean(best_matches) * 100
-                
+            partial_match_pct = self._partial_match_pct(normalized_candidate, normalized_job)
+            if partial_match_pct is not None:
                 # Combine exact and partial matching (weighted)
                 final_match = (exact_match_pct * 0.7) + (partial_match_pct * 0.3)
-            except:
+            else:
                 final_match = exact_match_pct
         else:
             final_match = exact_match_pct
-        
-        return min(100.0, final_match), list(matched), list(missing)
+
+        return min(100.0, final_match), tuple(matched), tuple(missing)
+
+    def _partial_match_pct(self, normalized_candidate, normalized_job):
+        """TF-IDF partial match percentage, or None if vectorization fails"""
+        # Fast path: all skills covered by the prepared corpus. Snapshot
+        # the published tuple once so a concurrent prepare() cannot swap
+        # the index out from under the row lookups
+        prepared = self._prepared
+        if prepared is not None:
+            index, tfidf_rows = prepared
+            cand_idx = [index.get(s) for s in normalized_candidate]
+            job_idx = [index.get(s) for s in normalized_job]
+            if None not in cand_idx and None not in job_idx:
+                similarities = (
+                    tfidf_rows[cand_idx] @ tfidf_rows[job_idx].T
+                ).toarray()
+                return similarities.max(axis=0).mean() * 100
+
+        # Fallback: fit on just this pair (ad-hoc skills outside the
+        # prepared corpus, or prepare() never called)
+        corpus = list(normalized_candidate) + list(normalized_job)
+        try:
+            tfidf_matrix = self.vectorizer.fit_transform(corpus)
+
+            # Get vectors for candidate and job skills
+            candidate_vector = tfidf_matrix[:len(normalized_candidate)]
+            job_vector = tfidf_matrix[len(normalized_candidate):]
+
+            # Calculate cosine similarity
+            similarities = cosine_similarity(candidate_vector, job_vector)
+
+            # Get best match for each job skill
+            best_matches = similarities.max(axis=0)
+            return np.mean(best_matches) * 100
+        except:
+            return None
     
     def get_skill_gap_analysis(
         self, 
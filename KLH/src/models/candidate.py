@@ -1,12 +1,14 @@
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Candidate:
     """Represents a job seeker candidate"""
-    
+
     candidate_id: str
     name: str
     email: str
@@ -16,12 +18,25 @@ class Candidate:
     preferred_location: str = ""
     expected_salary: int = 0
     resume_text: str = ""
-    
+
+    # Derived attributes attached after construction (data loader and
+    # dashboard); declared here so they get slots too
+    education_level: int = field(init=False, repr=False, compare=False)
+    skills_norm: tuple = field(init=False, repr=False, compare=False)
+    skills_set: frozenset = field(init=False, repr=False, compare=False)
+    location_parsed: Any = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Normalize skills to uppercase for consistent matching"""
         self.skills = [skill.strip().upper() for skill in self.skills]
         self.preferred_location = self.preferred_location.strip()
         self.education = self.education.strip()
+
+        # Canonical (alias-resolved) skills, computed once per record so
+        # matchers skip per-call normalization and set building
+        from ..matching.skill_matcher import SkillMatcher
+        self.skills_norm = tuple(SkillMatcher.normalize_skill(s) for s in self.skills)
+        self.skills_set = frozenset(self.skills_norm)
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -37,6 +52,28 @@ class Candidate:
             'resume_text': self.resume_text
         }
     
+    @staticmethod
+    def stack(candidates: List['Candidate']) -> Dict[str, np.ndarray]:
+        """
+        Stack the numeric attributes of many candidates into contiguous
+        arrays (structure-of-arrays layout).
+
+        Batch scoring broadcasts over these directly instead of chasing
+        one object per pair; education falls back to resolving the
+        string for ad-hoc records the loader did not annotate.
+        """
+        from ..matching.experience_matcher import ExperienceMatcher
+        edu_level = ExperienceMatcher()._get_education_level
+        return {
+            'years_experience': np.array(
+                [c.years_experience for c in candidates], dtype=np.float64),
+            'education_level': np.array(
+                [edu_level(getattr(c, 'education_level', c.education))
+                 for c in candidates], dtype=np.float64),
+            'expected_salary': np.array(
+                [c.expected_salary for c in candidates], dtype=np.float64),
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Candidate':
         """Create Candidate from dictionary"""
@@ -1,13 +1,15 @@
 """Job model for job matching"""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Job:
     """Represents a job posting"""
-    
+
     job_id: str
     title: str
     company: str
@@ -19,7 +21,14 @@ class Job:
     salary_max: int = 0
     description: str = ""
     is_remote: bool = False
-    
+
+    # Derived attributes attached after construction (data loader and
+    # dashboard); declared here so they get slots too
+    education_level_required: int = field(init=False, repr=False, compare=False)
+    required_norm: tuple = field(init=False, repr=False, compare=False)
+    required_set: frozenset = field(init=False, repr=False, compare=False)
+    location_parsed: Any = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Normalize skills to uppercase for consistent matching"""
         self.required_skills = [skill.strip().upper() for skill in self.required_skills]
@@ -27,6 +36,12 @@ class Job:
         self.education_required = self.education_required.strip()
         self.title = self.title.strip()
         self.company = self.company.strip()
+
+        # Canonical (alias-resolved) skills, computed once per record so
+        # matchers skip per-call normalization and set building
+        from ..matching.skill_matcher import SkillMatcher
+        self.required_norm = tuple(SkillMatcher.normalize_skill(s) for s in self.required_skills)
+        self.required_set = frozenset(self.required_norm)
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -44,6 +59,30 @@ class Job:
             'is_remote': self.is_remote
         }
     
+    @staticmethod
+    def stack(jobs: List['Job']) -> Dict[str, np.ndarray]:
+        """
+        Stack the numeric attributes of many jobs into contiguous arrays
+        (structure-of-arrays layout).
+
+        Batch scoring broadcasts over these directly instead of chasing
+        one object per pair; education falls back to resolving the
+        string for ad-hoc records the loader did not annotate.
+        """
+        from ..matching.experience_matcher import ExperienceMatcher
+        edu_level = ExperienceMatcher()._get_education_level
+        return {
+            'min_experience': np.array(
+                [j.min_experience for j in jobs], dtype=np.float64),
+            'education_level_required': np.array(
+                [edu_level(getattr(j, 'education_level_required', j.education_required))
+                 for j in jobs], dtype=np.float64),
+            'salary_min': np.array(
+                [j.salary_min for j in jobs], dtype=np.float64),
+            'salary_max': np.array(
+                [j.salary_max for j in jobs], dtype=np.float64),
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Job':
         """Create Job from dictionary"""
@@ -1,13 +1,15 @@
 """MatchResult model for storing matching results"""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class MatchResult:
     """Represents the matching result between a candidate and a job"""
-    
+
     candidate_id: str
     job_id: str
     match_score: float = 0.0
@@ -17,7 +19,11 @@ class MatchResult:
     salary_match: float = 0.0
     matched_skills: List[str] = field(default_factory=list)
     missing_skills: List[str] = field(default_factory=list)
-    
+
+    # Set by __post_init__; declared so they get slots too
+    level: str = field(init=False, repr=False, compare=False)
+    fmt: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Ensure scores are within valid range"""
         self.match_score = max(0.0, min(100.0, self.match_score))
@@ -25,7 +31,63 @@ class MatchResult:
         self.experience_match = max(0.0, min(100.0, self.experience_match))
         self.location_match = max(0.0, min(100.0, self.location_match))
         self.salary_match = max(0.0, min(100.0, self.salary_match))
+
+        # Cache the level and display strings so render loops don't
+        # re-derive them on every pass
+        self.level = self.get_match_level()
+        self.fmt = (
+            f"{self.match_score:.1f}%",
+            f"{self.skill_match:.1f}%",
+            f"{self.experience_match:.1f}%",
+            f"{self.location_match:.1f}%",
+            f"{self.salary_match:.1f}%"
+        )
     
+    @classmethod
+    def unchecked(
+        cls,
+        candidate_id: str,
+        job_id: str,
+        match_score: float,
+        skill_match: float,
+        experience_match: float,
+        location_match: float,
+        salary_match: float,
+        matched_skills: List[str],
+        missing_skills: List[str]
+    ) -> 'MatchResult':
+        """
+        Build a MatchResult from scores already known to be in 0-100,
+        skipping the __post_init__ clamping.
+
+        The matchers all clamp or floor their own outputs and the
+        overall score is a convex combination of them, so results built
+        by the engine cannot fall outside the range; re-clamping every
+        field per result is pure overhead on the hot path. from_dict
+        and other untrusted producers keep the checked constructor.
+        """
+        self = cls.__new__(cls)
+        self.candidate_id = candidate_id
+        self.job_id = job_id
+        self.match_score = match_score
+        self.skill_match = skill_match
+        self.experience_match = experience_match
+        self.location_match = location_match
+        self.salary_match = salary_match
+        self.matched_skills = matched_skills
+        self.missing_skills = missing_skills
+
+        # Same derived fields __post_init__ caches
+        self.level = self.get_match_level()
+        self.fmt = (
+            f"{match_score:.1f}%",
+            f"{skill_match:.1f}%",
+            f"{experience_match:.1f}%",
+            f"{location_match:.1f}%",
+            f"{salary_match:.1f}%"
+        )
+        return self
+
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         return {
@@ -40,6 +102,39 @@ class MatchResult:
             'missing_skills': self.missing_skills
         }
     
+    @staticmethod
+    def bulk_to_dicts(results: List['MatchResult']) -> List[dict]:
+        """
+        Convert many results to dictionaries in one pass.
+
+        Equivalent to [r.to_dict() for r in results], but the five score
+        fields are stacked into a numpy array and rounded vectorized
+        instead of five round() calls per result - faster for bulk
+        export (e.g. DataLoader.save_matches).
+        """
+        if not results:
+            return []
+
+        scores = np.round(np.array(
+            [(r.match_score, r.skill_match, r.experience_match,
+              r.location_match, r.salary_match) for r in results]
+        ), 2).tolist()
+
+        return [
+            {
+                'candidate_id': r.candidate_id,
+                'job_id': r.job_id,
+                'match_score': row[0],
+                'skill_match': row[1],
+                'experience_match': row[2],
+                'location_match': row[3],
+                'salary_match': row[4],
+                'matched_skills': r.matched_skills,
+                'missing_skills': r.missing_skills
+            }
+            for r, row in zip(results, scores)
+        ]
+
     @classmethod
     def from_dict(cls, data: dict) -> 'MatchResult':
         """Create MatchResult from dictionary"""
@@ -1,4 +1,5 @@
 # Utils package for data loading and utilities
 from .data_loader import DataLoader
+from .jit import njit, HAS_NUMBA
 
-__all__ = ['DataLoader']
+__all__ = ['DataLoader', 'njit', 'HAS_NUMBA']
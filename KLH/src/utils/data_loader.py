@@ -2,69 +2,168 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import List
 from ..models.candidate import Candidate
 from ..models.job import Job
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+
+# Project root and data directory, resolved once at import instead of
+# three dirname() walks per call
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DATA_DIR = os.path.join(_BASE_DIR, 'data')
+
 
 class DataLoader:
     """Utility class for loading sample data"""
-    
+
+    @staticmethod
+    def _read_json(file_path: str):
+        """Parse a JSON file, with orjson when available"""
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(file_path, 'r') as f:
+            return json.load(f)
+
     @staticmethod
     def load_candidates(file_path: str = None) -> List[Candidate]:
         """
         Load candidate data from JSON file.
-        
+
+        Repeat loads of an unchanged file return the cached list (treat
+        it as read-only); the file's mtime busts stale entries.
+
         Args:
             file_path: Path to candidates JSON file
-            
+
         Returns:
             List of Candidate objects
         """
         if file_path is None:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            file_path = os.path.join(base_dir, 'data', 'sample_candidates.json')
-        
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        return [Candidate.from_dict(c) for c in data]
+            file_path = os.path.join(_DATA_DIR, 'sample_candidates.json')
+
+        return DataLoader._load_candidates_cached(
+            file_path, os.path.getmtime(file_path))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_candidates_cached(file_path: str, mtime: float) -> List[Candidate]:
+        """Cached worker behind load_candidates"""
+        data = DataLoader._read_json(file_path)
+
+        # Imported here to avoid a circular import through the package inits
+        from ..matching.experience_matcher import ExperienceMatcher
+        from ..matching.location_matcher import LocationMatcher
+
+        candidates = [Candidate.from_dict(c) for c in data]
+
+        # Resolve education strings and parse locations once per record
+        # instead of per pair
+        location_matcher = LocationMatcher()
+        for candidate in candidates:
+            candidate.education_level = ExperienceMatcher.EDUCATION_LEVELS.get(
+                candidate.education.lower().strip(), 3)
+            candidate.location_parsed = location_matcher.parse_location(
+                candidate.preferred_location)
+
+        return candidates
     
     @staticmethod
     def load_jobs(file_path: str = None) -> List[Job]:
         """
         Load job data from JSON file.
-        
+
+        Repeat loads of an unchanged file return the cached list (treat
+        it as read-only); the file's mtime busts stale entries.
+
         Args:
             file_path: Path to jobs JSON file
-            
+
         Returns:
             List of Job objects
         """
         if file_path is None:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            file_path = os.path.join(base_dir, 'data', 'sample_jobs.json')
-        
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        return [Job.from_dict(j) for j in data]
+            file_path = os.path.join(_DATA_DIR, 'sample_jobs.json')
+
+        return DataLoader._load_jobs_cached(
+            file_path, os.path.getmtime(file_path))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_jobs_cached(file_path: str, mtime: float) -> List[Job]:
+        """Cached worker behind load_jobs"""
+        data = DataLoader._read_json(file_path)
+
+        # Imported here to avoid a circular import through the package inits
+        from ..matching.experience_matcher import ExperienceMatcher
+        from ..matching.location_matcher import LocationMatcher
+
+        jobs = [Job.from_dict(j) for j in data]
+
+        # Resolve education strings and parse locations once per record
+        # instead of per pair
+        location_matcher = LocationMatcher()
+        for job in jobs:
+            job.education_level_required = ExperienceMatcher.EDUCATION_LEVELS.get(
+                job.education_required.lower().strip(), 3)
+            job.location_parsed = location_matcher.parse_location(job.location)
+
+        return jobs
     
     @staticmethod
-    def save_matches(matches: List[dict], file_path: str = None):
+    def save_matches(matches: List[dict], file_path: str = None, ndjson: bool = False):
         """
         Save match results to JSON file.
-        
+
         Args:
             matches: List of match dictionaries
             file_path: Path to output file
+            ndjson: Write newline-delimited JSON instead of one array
         """
+        if ndjson:
+            DataLoader.save_matches_ndjson(matches, file_path)
+            return
+
         if file_path is None:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            file_path = os.path.join(base_dir, 'data', 'match_results.json')
-        
-        with open(file_path, 'w') as f:
-            json.dump(matches, f, indent=2)
+            file_path = os.path.join(_DATA_DIR, 'match_results.json')
+
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(matches, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(matches, f, indent=2)
+
+    @staticmethod
+    def save_matches_ndjson(matches: List[dict], file_path: str = None):
+        """
+        Save match results as newline-delimited JSON, one record per line.
+
+        Serializes and writes record by record, so peak memory stays at
+        one record regardless of list length, the file can be appended
+        to, and consumers can parse it incrementally.
+
+        Args:
+            matches: List of match dictionaries
+            file_path: Path to output file
+        """
+        if file_path is None:
+            file_path = os.path.join(_DATA_DIR, 'match_results.ndjson')
+
+        with open(file_path, 'wb') as f:
+            if orjson is not None:
+                for match in matches:
+                    f.write(orjson.dumps(match))
+                    f.write(b'\n')
+            else:
+                for match in matches:
+                    f.write(json.dumps(match).encode())
+                    f.write(b'\n')
     
     @staticmethod
     def load_matches(file_path: str = None) -> List[dict]:
@@ -78,11 +177,9 @@ class DataLoader:
             List of match dictionaries
         """
         if file_path is None:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            file_path = os.path.join(base_dir, 'data', 'match_results.json')
-        
+            file_path = os.path.join(_DATA_DIR, 'match_results.json')
+
         if not os.path.exists(file_path):
             return []
-        
-        with open(file_path, 'r') as f:
-            return json.load(f)
+
+        return DataLoader._read_json(file_path)
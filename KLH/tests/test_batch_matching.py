@@ -0,0 +1,278 @@
+"""Tests for the batch scoring paths and bulk export helpers"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+
+import numpy as np
+import pytest
+
+from src.models.candidate import Candidate
+from src.models.job import Job
+from src.models.match_result import MatchResult
+from src.matching.matching_engine import MatchingEngine
+from src.matching.skill_matcher import SkillMatcher
+from src.matching.experience_matcher import ExperienceMatcher
+from src.matching.salary_matcher import SalaryMatcher
+from src.utils.data_loader import DataLoader
+
+
+def _sample_candidates():
+    return [
+        Candidate(
+            candidate_id="C001", name="Alice", email="alice@test.com",
+            skills=["Python", "Machine Learning", "SQL"],
+            years_experience=5, education="Master's",
+            preferred_location="San Francisco, CA", expected_salary=120000
+        ),
+        Candidate(
+            candidate_id="C002", name="Bob", email="bob@test.com",
+            skills=["Java", "Spring Boot"],
+            years_experience=3, education="Bachelor's",
+            preferred_location="New York, NY", expected_salary=80000
+        ),
+        Candidate(
+            candidate_id="C003", name="Carol", email="carol@test.com",
+            skills=["ML", "AWS", "Docker"],
+            years_experience=1, education="High School",
+            preferred_location="Remote", expected_salary=0
+        ),
+        Candidate(
+            candidate_id="C004", name="Dan", email="dan@test.com",
+            skills=[],
+            years_experience=10, education="PhD",
+            preferred_location="Austin, TX", expected_salary=200000
+        ),
+    ]
+
+
+def _sample_jobs():
+    return [
+        Job(
+            job_id="J001", title="ML Engineer", company="TechCorp",
+            required_skills=["Python", "Machine Learning", "TensorFlow"],
+            min_experience=4, education_required="Master's",
+            location="San Francisco, CA",
+            salary_min=130000, salary_max=180000
+        ),
+        Job(
+            job_id="J002", title="Java Developer", company="Enterprise Inc",
+            required_skills=["Java", "Spring Boot"],
+            min_experience=2, education_required="Bachelor's",
+            location="New York, NY",
+            salary_min=70000, salary_max=100000
+        ),
+        Job(
+            job_id="J003", title="Cloud Engineer", company="Cloudy",
+            required_skills=["AWS", "Docker", "Kubernetes"],
+            min_experience=0, education_required="Bachelor's",
+            location="Remote", salary_min=0, salary_max=0, is_remote=True
+        ),
+        Job(
+            job_id="J004", title="Intern", company="StartUp",
+            required_skills=[],
+            min_experience=0, education_required="High School",
+            location="Austin, TX", salary_min=30000, salary_max=40000
+        ),
+    ]
+
+
+class TestBatchMatcherParity:
+    """Batch matcher kernels must mirror their scalar counterparts"""
+
+    def test_salary_batch_matches_scalar(self):
+        matcher = SalaryMatcher()
+        expected = np.array([0, 50000, 100000, 150000])
+        sal_min = np.array([0, 80000, 80000, 0])
+        sal_max = np.array([0, 120000, 120000, 0])
+
+        batch = matcher.calculate_salary_match_batch(
+            expected[:, None], sal_min[None, :], sal_max[None, :])
+
+        for c, exp in enumerate(expected):
+            for j in range(len(sal_min)):
+                scalar = matcher.calculate_salary_match(
+                    int(exp), int(sal_min[j]), int(sal_max[j]))
+                assert batch[c, j] == pytest.approx(scalar)
+
+    def test_experience_batch_matches_scalar(self):
+        matcher = ExperienceMatcher()
+        cand_exp = np.array([0, 2, 5, 10])
+        cand_edu = np.array([1, 3, 4, 5])
+        job_min = np.array([0, 3, 5, 8])
+        job_edu = np.array([1, 3, 4, 5])
+
+        batch = matcher.calculate_combined_experience_match_batch(
+            cand_exp[:, None], job_min[None, :],
+            cand_edu[:, None], job_edu[None, :])
+
+        for c in range(len(cand_exp)):
+            for j in range(len(job_min)):
+                scalar = matcher.calculate_combined_experience_match(
+                    int(cand_exp[c]), int(job_min[j]),
+                    int(cand_edu[c]), int(job_edu[j]))
+                assert batch[c, j] == pytest.approx(scalar)
+
+    def test_exact_match_matrix_matches_set_math(self):
+        matcher = SkillMatcher()
+        cand_lists = [c.skills_norm for c in _sample_candidates()]
+        job_lists = [j.required_norm for j in _sample_jobs()]
+
+        vocab = matcher.build_vocabulary(cand_lists + job_lists)
+        cand_masks = np.stack([matcher.encode_mask(s, vocab) for s in cand_lists])
+        job_masks = np.stack([matcher.encode_mask(s, vocab) for s in job_lists])
+        required = np.array([len(s) for s in job_lists])
+
+        matrix = matcher.exact_match_matrix(cand_masks, job_masks, required)
+
+        for c, cand in enumerate(cand_lists):
+            for j, job in enumerate(job_lists):
+                if not job:
+                    expected = 100.0
+                else:
+                    expected = len(set(cand) & set(job)) / len(job) * 100
+                assert matrix[c, j] == pytest.approx(expected)
+
+    def test_partial_match_matrix_matches_scalar(self):
+        matcher = SkillMatcher()
+        cand_lists = [c.skills_norm for c in _sample_candidates()]
+        job_lists = [j.required_norm for j in _sample_jobs()]
+
+        prepared = matcher.prepare(cand_lists + job_lists)
+        matrix = matcher.partial_match_matrix(cand_lists, job_lists, prepared)
+
+        for c, cand in enumerate(cand_lists):
+            for j, job in enumerate(job_lists):
+                if not cand or not job:
+                    assert np.isnan(matrix[c, j])
+                else:
+                    scalar = matcher._partial_match_pct(cand, job)
+                    assert matrix[c, j] == pytest.approx(scalar)
+
+
+class TestScoreMatrixParity:
+    """score_matrix must agree with the scalar pair path everywhere"""
+
+    def setup_method(self):
+        self.engine = MatchingEngine()
+        self.candidates = _sample_candidates()
+        self.jobs = _sample_jobs()
+
+    def test_overall_matches_pair_scoring(self):
+        overall = self.engine.score_matrix(self.candidates, self.jobs)[0]
+        for c, candidate in enumerate(self.candidates):
+            for j, job in enumerate(self.jobs):
+                pair = self.engine.match_candidate_to_job(candidate, job)
+                assert overall[c, j] == pytest.approx(pair.match_score)
+
+    def test_components_match_pair_scoring(self):
+        _, skill, experience, location, salary = self.engine.score_matrix(
+            self.candidates, self.jobs)
+        for c, candidate in enumerate(self.candidates):
+            for j, job in enumerate(self.jobs):
+                pair = self.engine.match_candidate_to_job(candidate, job)
+                assert skill[c, j] == pytest.approx(pair.skill_match)
+                assert experience[c, j] == pytest.approx(pair.experience_match)
+                assert location[c, j] == pytest.approx(pair.location_match)
+                assert salary[c, j] == pytest.approx(pair.salary_match)
+
+    def test_sample_data_parity(self):
+        candidates = DataLoader.load_candidates()
+        jobs = DataLoader.load_jobs()
+        overall = self.engine.score_matrix(candidates, jobs)[0]
+        for c, candidate in enumerate(candidates):
+            for j, job in enumerate(jobs):
+                pair = self.engine.match_candidate_to_job(candidate, job)
+                assert overall[c, j] == pytest.approx(pair.match_score)
+
+    def test_top_k_is_head_of_full_ranking(self):
+        full = self.engine.match_candidate_to_jobs(
+            self.candidates[0], self.jobs, min_threshold=0)
+        top = self.engine.match_candidate_to_jobs(
+            self.candidates[0], self.jobs, min_threshold=0, top_k=2)
+        assert [m.job_id for m in top] == [m.job_id for m in full[:2]]
+
+        full_rev = self.engine.match_job_to_candidates(
+            self.jobs[0], self.candidates, min_threshold=0)
+        top_rev = self.engine.match_job_to_candidates(
+            self.jobs[0], self.candidates, min_threshold=0, top_k=2)
+        assert [m.candidate_id for m in top_rev] == \
+            [m.candidate_id for m in full_rev[:2]]
+
+
+class TestMatchResultBulk:
+    """Trusted construction and bulk export of MatchResult"""
+
+    def _result(self):
+        return MatchResult(
+            candidate_id="C001", job_id="J001",
+            match_score=87.654, skill_match=90.0, experience_match=85.0,
+            location_match=75.0, salary_match=100.0,
+            matched_skills=["PYTHON"], missing_skills=["TENSORFLOW"]
+        )
+
+    def test_unchecked_equals_checked(self):
+        checked = self._result()
+        unchecked = MatchResult.unchecked(
+            candidate_id="C001", job_id="J001",
+            match_score=87.654, skill_match=90.0, experience_match=85.0,
+            location_match=75.0, salary_match=100.0,
+            matched_skills=["PYTHON"], missing_skills=["TENSORFLOW"]
+        )
+        assert unchecked == checked
+        assert unchecked.level == checked.level
+        assert unchecked.fmt == checked.fmt
+
+    def test_bulk_to_dicts_equals_to_dict(self):
+        results = [self._result() for _ in range(3)]
+        assert MatchResult.bulk_to_dicts(results) == [r.to_dict() for r in results]
+
+    def test_bulk_to_dicts_empty(self):
+        assert MatchResult.bulk_to_dicts([]) == []
+
+
+class TestNdjsonExport:
+    """NDJSON output of save_matches"""
+
+    def test_ndjson_round_trip(self, tmp_path):
+        matches = [
+            {"candidate_id": "C001", "job_id": "J001", "match_score": 91.5},
+            {"candidate_id": "C002", "job_id": "J002", "match_score": 45.0},
+        ]
+        path = str(tmp_path / "matches.ndjson")
+        DataLoader.save_matches(matches, path, ndjson=True)
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line) for line in lines] == matches
+
+
+class TestApiCaching:
+    """ETag/304 handling on the cached API responses"""
+
+    def setup_method(self):
+        from src.api.routes import create_app
+        self.client = create_app().test_client()
+
+    def test_candidates_etag_returns_304(self):
+        first = self.client.get('/api/candidates')
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+
+        second = self.client.get(
+            '/api/candidates', headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.get_data() == b''
+
+    def test_jobs_etag_returns_304(self):
+        first = self.client.get('/api/jobs')
+        assert first.status_code == 200
+        second = self.client.get(
+            '/api/jobs', headers={'If-None-Match': first.headers['ETag']})
+        assert second.status_code == 304
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])